@@ -1,22 +1,46 @@
 """Living Engine SDK public API."""
 
 from .backtest_runner import BacktestRunner
+from .bars import (
+    BarRule,
+    TickAggregator,
+    aggregate_csv,
+    aggregate_ticks,
+    drive_strategy,
+    stream_bars,
+)
 from .entropy import RegimeName, RegimeResult, classify_regime
 from .imm_core import ImmCore
 from .narrative import make_day_summary
 from .proofbridge import ProofBridge, sha256_file
+from .robustness import robustness_report
+from .shared_frame import SharedFrame, SharedFrameSpec
 from .strategy_api import StrategyBase
+from .verify import RunVerification, validate_capsule, verify_run, verify_runs
 
 __all__ = [
     "BacktestRunner",
+    "BarRule",
     "ImmCore",
     "ProofBridge",
     "RegimeName",
     "RegimeResult",
+    "RunVerification",
+    "SharedFrame",
+    "SharedFrameSpec",
     "StrategyBase",
+    "TickAggregator",
+    "aggregate_csv",
+    "aggregate_ticks",
     "classify_regime",
+    "drive_strategy",
     "make_day_summary",
+    "robustness_report",
     "sha256_file",
+    "stream_bars",
+    "validate_capsule",
+    "verify_run",
+    "verify_runs",
 ]
 
 __version__ = "0.1.0"
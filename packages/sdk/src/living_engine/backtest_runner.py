@@ -14,6 +14,8 @@ except Exception:  # pragma: no cover
 from living_engine.imm_core import ImmCore
 from living_engine.narrative import make_day_summary
 from living_engine.proofbridge import ProofBridge, sha256_file
+from living_engine.robustness import robustness_report
+from living_engine.shared_frame import SharedFrame, SharedFrameSpec
 
 
 def _read_yaml(path: Path) -> Dict:
@@ -56,9 +58,9 @@ def _sharpe(returns) -> float:
 class BacktestRunner:
     """Tiny orchestrator used by tests and examples."""
 
-    def __init__(self, config: Dict, frame):
+    def __init__(self, config: Dict, frame, copy: bool = True):
         self.cfg = config
-        self.df = frame.copy()
+        self.df = frame.copy() if copy else frame
 
     @classmethod
     def from_files(cls, cfg_path: str | Path, csv_path: str | Path) -> "BacktestRunner":
@@ -68,6 +70,11 @@ class BacktestRunner:
         df = pd.read_csv(csv_path)
         return cls(cfg, df)
 
+    @classmethod
+    def from_shared(cls, config: Dict, spec: SharedFrameSpec) -> "BacktestRunner":
+        """Build a runner on a dataset published by :meth:`SharedFrame.publish` without copying."""
+        return cls(config, SharedFrame.attach(spec).to_frame(), copy=False)
+
     def run(self, outdir: str | Path) -> Dict[str, str]:
         out = Path(outdir)
         out.mkdir(parents=True, exist_ok=True)
@@ -162,6 +169,17 @@ class BacktestRunner:
             "evidence": {"collapse_hits": collapse_hits},
             "metrics": metrics,
         }
+        robust_cfg = self.cfg.get("robustness")
+        if robust_cfg:
+            capsule["robustness"] = robustness_report(
+                returns,
+                trades,
+                n_paths=int(robust_cfg.get("Paths", 1000)),
+                block_size=int(robust_cfg.get("BlockSize", 5)),
+                start_equity=metrics["start_equity"],
+                seed=robust_cfg.get("Seed"),
+                chunk_paths=int(robust_cfg.get("ChunkPaths", 256)),
+            )
         capsule_path = out / "proof_capsule.json"
         capsule_path.write_text(json.dumps(capsule, indent=2))
 
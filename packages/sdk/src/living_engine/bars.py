@@ -0,0 +1,390 @@
+"""Aggregate trade ticks into OHLCV bars.
+
+Ticks are mappings (or DataFrame rows) with ``timestamp``, ``price`` and ``size`` keys, plus
+optional ``symbol`` (default ``"X"``) and ``entropy`` (default ``0.0``). Bars follow the SDK bar
+schema ``timestamp, symbol, open, high, low, close, volume, entropy`` where ``entropy`` is the mean
+tick entropy in the bar. Ticks must be time-ordered within each symbol.
+
+Three bar rules are supported, each applied per symbol:
+
+* ``time``   – fixed intervals of ``threshold`` seconds, stamped with the interval start.
+* ``tick``   – every ``threshold`` ticks, stamped with the last tick.
+* ``volume`` – closes on the tick whose cumulative volume reaches the next multiple of
+  ``threshold``, stamped with the last tick. Ticks are never split.
+
+The bulk path (:func:`aggregate_ticks`, :func:`aggregate_csv`) works on NumPy arrays a chunk at a
+time and carries only a reduced partial bar (OHLC, volume, entropy sum, tick count) per symbol
+between chunks. The incremental path
+(:class:`TickAggregator`, :func:`stream_bars`, :func:`drive_strategy`) keeps one open bar per
+symbol. Both paths draw bar boundaries identically.
+
+Time-zone-aware timestamps are compared in UTC, so ticks may carry different offsets (e.g. across a
+DST change). Output bars are stamped in the zone of the first tick. Timestamps parsed from strings
+carry a fixed offset; convert them to a named zone first to get DST-aware stamps. Time buckets are
+always aligned to the UTC epoch, so e.g. daily bars close at UTC midnight. Mixing naive and aware
+timestamps within one aggregation raises ``ValueError``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .strategy_api import BarData, Capsule, Order, StrategyBase
+
+BarKind = Literal["time", "tick", "volume"]
+
+BAR_COLUMNS = ("timestamp", "symbol", "open", "high", "low", "close", "volume", "entropy")
+
+
+@dataclass(frozen=True)
+class BarRule:
+    """How ticks are grouped into bars. ``threshold`` is seconds, ticks, or volume units."""
+
+    kind: BarKind
+    threshold: float
+
+    def __post_init__(self) -> None:
+        if self.kind not in ("time", "tick", "volume"):
+            raise ValueError(f"Unknown bar kind: {self.kind!r}.")
+        if not self.threshold > 0:
+            raise ValueError("Bar threshold must be positive.")
+        if self.kind == "tick" and int(self.threshold) != self.threshold:
+            raise ValueError("Tick bar threshold must be a whole number of ticks.")
+        if self.kind == "time" and self.interval_ns == 0:
+            raise ValueError("Time bar threshold is below nanosecond resolution.")
+
+    @property
+    def interval_ns(self) -> int:
+        return int(round(self.threshold * 1e9))
+
+
+_UNSET: Any = object()
+
+
+def _merge_tz(seen: Any, tz: Any) -> Any:
+    """Keep the first input's zone; only a mix of naive and aware timestamps is rejected."""
+
+    if seen is _UNSET:
+        return tz
+    if (seen is None) != (tz is None):
+        raise ValueError("Ticks mix naive and time-zone-aware timestamps.")
+    return seen
+
+
+def _to_ns(timestamp: Any) -> Tuple[int, Any]:
+    """UTC nanoseconds since the epoch and the time zone of ``timestamp`` (``None`` if naive)."""
+
+    import pandas as pd
+
+    ts = pd.Timestamp(timestamp)
+    return int(ts.value), ts.tz
+
+
+def _format_ns(ns: int, tz: Any) -> str:
+    import pandas as pd
+
+    if tz is None:
+        return str(pd.Timestamp(ns))
+    return str(pd.Timestamp(ns, tz="UTC").tz_convert(tz))
+
+
+# ----------------------------------------------------------------------
+# incremental path
+class _OpenBar:
+    __slots__ = ("bucket", "open", "high", "low", "close", "volume", "entropy_sum", "count", "ns")
+
+    def __init__(self, bucket: int, price: float) -> None:
+        self.bucket = bucket
+        self.open = self.high = self.low = self.close = price
+        self.volume = 0.0
+        self.entropy_sum = 0.0
+        self.count = 0
+        self.ns = 0
+
+    def add(self, ns: int, price: float, size: float, entropy: float) -> None:
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += size
+        self.entropy_sum += entropy
+        self.count += 1
+        self.ns = ns
+
+
+class TickAggregator:
+    """Incrementally build bars from a tick stream with one open bar per symbol."""
+
+    def __init__(self, rule: BarRule):
+        self.rule = rule
+        self._bars: Dict[str, _OpenBar] = {}
+        self._volume: Dict[str, float] = {}
+        self._ticks: Dict[str, int] = {}
+        self._tz: Any = _UNSET
+
+    def update(self, tick: Mapping[str, Any]) -> Optional[BarData]:
+        """Consume one tick and return the bar it completed, if any."""
+
+        symbol = str(tick.get("symbol", "X"))
+        ns, tz = _to_ns(tick["timestamp"])
+        self._tz = _merge_tz(self._tz, tz)
+        price = float(tick["price"])
+        size = float(tick["size"])
+        entropy = float(tick.get("entropy", 0.0))
+        rule = self.rule
+
+        done: Optional[BarData] = None
+        bar = self._bars.get(symbol)
+        if rule.kind == "time":
+            bucket = ns // rule.interval_ns
+            if bar is not None and bar.bucket != bucket:
+                done = self._emit(symbol, bar)
+                bar = None
+            if bar is None:
+                bar = self._bars[symbol] = _OpenBar(bucket, price)
+            bar.add(ns, price, size, entropy)
+            return done
+
+        if bar is None:
+            bar = self._bars[symbol] = _OpenBar(0, price)
+        bar.add(ns, price, size, entropy)
+        if rule.kind == "tick":
+            count = self._ticks.get(symbol, 0) + 1
+            self._ticks[symbol] = count
+            closed = count % int(rule.threshold) == 0
+        else:
+            before = self._volume.get(symbol, 0.0)
+            after = self._volume[symbol] = before + size
+            closed = (after // rule.threshold) > (before // rule.threshold)
+        if closed:
+            del self._bars[symbol]
+            return self._emit(symbol, bar)
+        return None
+
+    def flush(self) -> List[BarData]:
+        """Emit every unfinished bar and reset tick/volume counts, e.g. at the end of a session."""
+
+        bars = [self._emit(symbol, bar) for symbol, bar in self._bars.items()]
+        self._bars.clear()
+        self._ticks.clear()
+        self._volume.clear()
+        return bars
+
+    def _emit(self, symbol: str, bar: _OpenBar) -> BarData:
+        ns = bar.bucket * self.rule.interval_ns if self.rule.kind == "time" else bar.ns
+        return {
+            "timestamp": _format_ns(ns, self._tz),
+            "symbol": symbol,
+            "open": bar.open,
+            "high": bar.high,
+            "low": bar.low,
+            "close": bar.close,
+            "volume": bar.volume,
+            "entropy": bar.entropy_sum / bar.count,
+        }
+
+
+def stream_bars(ticks: Iterable[Mapping[str, Any]], rule: BarRule) -> Iterator[BarData]:
+    """Yield bars as they complete, flushing unfinished bars once ``ticks`` is exhausted."""
+
+    aggregator = TickAggregator(rule)
+    for tick in ticks:
+        bar = aggregator.update(tick)
+        if bar is not None:
+            yield bar
+    yield from aggregator.flush()
+
+
+def drive_strategy(
+    strategy: StrategyBase,
+    ticks: Iterable[Mapping[str, Any]],
+    rule: BarRule,
+) -> Iterator[Tuple[BarData, Optional[Order], Optional[Capsule]]]:
+    """Feed bars built from ``ticks`` straight into ``strategy.on_bar``.
+
+    Lifecycle hooks (``on_start``/``on_finish``) are left to the caller.
+    """
+
+    for bar in stream_bars(ticks, rule):
+        order, capsule = strategy.on_bar(bar)
+        yield bar, order, capsule
+
+
+# ----------------------------------------------------------------------
+# bulk path
+def _bar_ids(ns: np.ndarray, size: np.ndarray, rule: BarRule, volume0: float, ticks0: int):
+    """Bar id per tick for one symbol, given the volume/tick count seen before these ticks."""
+
+    if rule.kind == "time":
+        return ns // rule.interval_ns, None
+    if rule.kind == "tick":
+        return (ticks0 + np.arange(len(ns))) // int(rule.threshold), None
+    cumulative = np.cumsum(np.concatenate(([volume0], size)))
+    return cumulative[:-1] // rule.threshold, cumulative
+
+
+def _reduce(ids, ns, price, size, entropy) -> Dict[str, np.ndarray]:
+    """Collapse consecutive ticks sharing a bar id into partial bars, one row per bar."""
+
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    ends = np.r_[starts[1:], len(ids)] - 1
+    return {
+        "id": ids[starts],
+        "ns": ns[ends],
+        "open": price[starts],
+        "high": np.maximum.reduceat(price, starts),
+        "low": np.minimum.reduceat(price, starts),
+        "close": price[ends],
+        "volume": np.add.reduceat(size, starts),
+        "entropy_sum": np.add.reduceat(entropy, starts),
+        "count": ends - starts + 1,
+    }
+
+
+class _BulkAggregator:
+    """Chunked vectorised aggregation carrying each symbol's unfinished bar forward.
+
+    Only a reduced partial bar (a single row of :func:`_reduce` output) is carried per symbol, so
+    memory does not grow with the number of ticks in a bar.
+    """
+
+    def __init__(self, rule: BarRule):
+        self.rule = rule
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._volume: Dict[str, float] = {}
+        self._ticks: Dict[str, int] = {}
+        self._out: List[Dict[str, np.ndarray]] = []
+        self._tz: Any = _UNSET
+
+    def add(self, frame) -> None:
+        import pandas as pd
+
+        if len(frame) == 0:
+            return
+        raw = frame["timestamp"]
+        if pd.api.types.is_datetime64_any_dtype(raw):
+            tz = raw.dt.tz
+        else:
+            tz = pd.Timestamp(raw.iloc[0]).tz
+        self._tz = _merge_tz(self._tz, tz)
+        stamps = pd.DatetimeIndex(pd.to_datetime(raw, utc=True)).tz_localize(None)
+        ns = stamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        price = frame["price"].to_numpy(dtype=float)
+        size = frame["size"].to_numpy(dtype=float)
+        if "entropy" in frame:
+            entropy = frame["entropy"].to_numpy(dtype=float)
+        else:
+            entropy = np.zeros(len(frame))
+        if "symbol" in frame:
+            symbols = frame["symbol"].astype(str).to_numpy()
+        else:
+            symbols = np.full(len(frame), "X", dtype=object)
+
+        codes, uniques = pd.factorize(symbols)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.r_[0, np.cumsum(np.bincount(codes, minlength=len(uniques)))]
+        for k, symbol in enumerate(uniques):
+            rows = order[bounds[k] : bounds[k + 1]]
+            self._symbol(str(symbol), (ns[rows], price[rows], size[rows], entropy[rows]))
+
+    def _symbol(self, symbol: str, arrays: Tuple[np.ndarray, ...]) -> None:
+        ns, price, size, entropy = arrays
+        volume0 = self._volume.get(symbol, 0.0)
+        ticks0 = self._ticks.get(symbol, 0)
+        ids, cumulative = _bar_ids(ns, size, self.rule, volume0, ticks0)
+        self._ticks[symbol] = ticks0 + len(ns)
+        if cumulative is not None:
+            self._volume[symbol] = float(cumulative[-1])
+
+        bars = _reduce(ids, ns, price, size, entropy)
+        partial = self._pending.pop(symbol, None)
+        if partial is not None:
+            if partial["id"] == bars["id"][0]:
+                bars["open"][0] = partial["open"]
+                bars["high"][0] = max(bars["high"][0], partial["high"])
+                bars["low"][0] = min(bars["low"][0], partial["low"])
+                for key in ("volume", "entropy_sum", "count"):
+                    bars[key][0] += partial[key]
+            else:
+                self._emit(symbol, {key: np.array([value]) for key, value in partial.items()})
+
+        # The last bar may still grow with the next chunk.
+        self._pending[symbol] = {key: values[-1] for key, values in bars.items()}
+        if len(bars["id"]) > 1:
+            self._emit(symbol, {key: values[:-1] for key, values in bars.items()})
+
+    def _emit(self, symbol: str, bars: Dict[str, np.ndarray]) -> None:
+        if self.rule.kind == "time":
+            stamps = bars["id"].astype(np.int64) * self.rule.interval_ns
+        else:
+            stamps = bars["ns"]
+        self._out.append(
+            {
+                "timestamp": stamps,
+                "symbol": np.full(len(stamps), symbol, dtype=object),
+                "open": bars["open"],
+                "high": bars["high"],
+                "low": bars["low"],
+                "close": bars["close"],
+                "volume": bars["volume"],
+                "entropy": bars["entropy_sum"] / bars["count"],
+            }
+        )
+
+    def finish(self):
+        import pandas as pd
+
+        for symbol, partial in self._pending.items():
+            self._emit(symbol, {key: np.array([value]) for key, value in partial.items()})
+        self._pending.clear()
+
+        if not self._out:
+            return pd.DataFrame({name: [] for name in BAR_COLUMNS})
+        data = {name: np.concatenate([part[name] for part in self._out]) for name in BAR_COLUMNS}
+        frame = pd.DataFrame(data)
+        frame["timestamp"] = pd.to_datetime(data["timestamp"].view("datetime64[ns]"))
+        if self._tz is not None:
+            frame["timestamp"] = frame["timestamp"].dt.tz_localize("UTC").dt.tz_convert(self._tz)
+        frame = frame.sort_values(["timestamp", "symbol"], kind="stable")
+        return frame.reset_index(drop=True)
+
+
+def aggregate_ticks(frame, rule: BarRule):
+    """Aggregate a tick DataFrame into a bar DataFrame sorted by timestamp, then symbol."""
+
+    aggregator = _BulkAggregator(rule)
+    aggregator.add(frame)
+    return aggregator.finish()
+
+
+def aggregate_csv(path: Path | str, rule: BarRule, chunksize: int = 1_000_000):
+    """Aggregate a tick CSV in chunks of ``chunksize`` rows.
+
+    Memory is bounded by one chunk plus a fixed-size partial bar per symbol, however many chunks a
+    bar spans. The result can be passed
+    straight to :class:`BacktestRunner`.
+    """
+
+    import pandas as pd
+
+    aggregator = _BulkAggregator(rule)
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        aggregator.add(chunk)
+    return aggregator.finish()
+
+
+__all__ = [
+    "BAR_COLUMNS",
+    "BarKind",
+    "BarRule",
+    "TickAggregator",
+    "aggregate_csv",
+    "aggregate_ticks",
+    "drive_strategy",
+    "stream_bars",
+]
@@ -64,12 +64,12 @@ class ProofBridge:
         self.close()
 
 
-def sha256_file(path: Path | str) -> str:
-    """Compute the SHA-256 digest of a file."""
+def sha256_file(path: Path | str, chunk_size: int = 1 << 20) -> str:
+    """Compute the SHA-256 digest of a file, reading ``chunk_size`` bytes at a time."""
 
     digest = hashlib.sha256()
     with Path(path).open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
             if not chunk:
                 break
             digest.update(chunk)
@@ -0,0 +1,230 @@
+"""Monte Carlo robustness analysis for backtest results.
+
+Instead of re-running a backtest on perturbed data, the helpers here resample the outcome of a
+single run. Every resampled path is evaluated with NumPy in batches of ``chunk_paths`` rows, so
+thousands of paths cost a handful of array operations while peak memory stays bounded by
+``chunk_paths * len(returns)`` floats.
+
+Two resampling schemes are provided:
+
+* **block bootstrap** – the per-bar return series is rebuilt from randomly chosen contiguous
+  blocks, which keeps short-range autocorrelation intact.
+* **trade shuffle** – the realised profit of each round-trip trade is replayed in random order,
+  exposing how much of the drawdown depended on the trade sequence.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+
+_PERCENTILES = (5.0, 50.0, 95.0)
+
+
+def _batches(n_paths: int, chunk_paths: int) -> Iterator[int]:
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive.")
+    if chunk_paths <= 0:
+        raise ValueError("chunk_paths must be positive.")
+    for start in range(0, n_paths, chunk_paths):
+        yield min(chunk_paths, n_paths - start)
+
+
+def _sharpe(paths: np.ndarray) -> np.ndarray:
+    """Row-wise annualised Sharpe ratio matching :func:`backtest_runner._sharpe`."""
+
+    if paths.shape[1] < 2:
+        return np.zeros(paths.shape[0])
+    mu = paths.mean(axis=1)
+    sd = paths.std(axis=1, ddof=1)
+    out = np.zeros_like(mu)
+    np.divide(mu, sd, out=out, where=sd > 0)
+    return out * math.sqrt(252)
+
+
+def _max_drawdown(equity: np.ndarray) -> np.ndarray:
+    """Row-wise maximum fractional drawdown of equity curves."""
+
+    peak = np.maximum.accumulate(equity, axis=1)
+    dd = np.zeros_like(equity)
+    np.divide(peak - equity, peak, out=dd, where=peak > 0)
+    return dd.max(axis=1)
+
+
+def bootstrap_returns(
+    returns: Sequence[float],
+    *,
+    n_paths: int = 1000,
+    block_size: int = 5,
+    start_equity: float = 50_000.0,
+    seed: Optional[int] = None,
+    chunk_paths: int = 256,
+) -> Dict[str, np.ndarray]:
+    """Moving-block bootstrap of a per-bar return series.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Per-path samples of ``sharpe``, ``max_drawdown`` and ``final_equity``.
+    """
+
+    r = np.asarray(returns, dtype=float)
+    n_bars = r.size
+    if n_bars == 0:
+        raise ValueError("returns must not be empty.")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive.")
+    block = min(block_size, n_bars)
+    n_blocks = -(-n_bars // block)
+    offsets = np.arange(block)
+    rng = np.random.default_rng(seed)
+
+    sharpe, max_dd, final = [], [], []
+    for size in _batches(n_paths, chunk_paths):
+        starts = rng.integers(0, n_bars - block + 1, size=(size, n_blocks))
+        idx = (starts[:, :, None] + offsets).reshape(size, -1)[:, :n_bars]
+        paths = r[idx]
+
+        equity = np.empty((size, n_bars + 1))
+        equity[:, 0] = 1.0
+        np.cumprod(1.0 + paths, axis=1, out=equity[:, 1:])
+
+        sharpe.append(_sharpe(paths))
+        max_dd.append(_max_drawdown(equity))
+        final.append(start_equity * equity[:, -1])
+
+    return {
+        "sharpe": np.concatenate(sharpe),
+        "max_drawdown": np.concatenate(max_dd),
+        "final_equity": np.concatenate(final),
+    }
+
+
+def round_trip_pnl(trades: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """Pair ``BUY``/``SELL`` blotter rows into realised round-trip profits.
+
+    A trailing ``BUY`` without a matching ``SELL`` is ignored.
+    """
+
+    pnl = []
+    entry: Optional[Mapping[str, Any]] = None
+    for trade in trades:
+        if trade["action"] == "BUY":
+            entry = trade
+        elif trade["action"] == "SELL" and entry is not None:
+            pnl.append(float(trade["size"]) * (float(trade["px"]) - float(entry["px"])))
+            entry = None
+    return np.asarray(pnl, dtype=float)
+
+
+def shuffle_trades(
+    trades: Sequence[Mapping[str, Any]],
+    *,
+    n_paths: int = 1000,
+    start_equity: float = 50_000.0,
+    seed: Optional[int] = None,
+    chunk_paths: int = 256,
+) -> Dict[str, np.ndarray]:
+    """Replay round-trip profits in random order.
+
+    Final equity is invariant under reordering, so only ``max_drawdown`` is sampled. Drawdown is
+    measured between trades; intra-trade excursions are not visible in a blotter.
+    """
+
+    pnl = round_trip_pnl(trades)
+    if pnl.size == 0:
+        raise ValueError("trades must contain at least one round trip.")
+    rng = np.random.default_rng(seed)
+
+    max_dd = []
+    for size in _batches(n_paths, chunk_paths):
+        order = rng.permuted(np.broadcast_to(pnl, (size, pnl.size)), axis=1)
+        equity = np.empty((size, pnl.size + 1))
+        equity[:, 0] = start_equity
+        np.cumsum(order, axis=1, out=equity[:, 1:])
+        equity[:, 1:] += start_equity
+        max_dd.append(_max_drawdown(equity))
+
+    return {"max_drawdown": np.concatenate(max_dd)}
+
+
+def summarize(samples: Mapping[str, np.ndarray]) -> Dict[str, Dict[str, float]]:
+    """Reduce per-path samples to ``mean``, ``std`` and 5th/50th/95th percentiles."""
+
+    out: Dict[str, Dict[str, float]] = {}
+    for key, values in samples.items():
+        p05, p50, p95 = np.percentile(values, _PERCENTILES)
+        out[key] = {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "p05": float(p05),
+            "p50": float(p50),
+            "p95": float(p95),
+        }
+    return out
+
+
+def robustness_report(
+    returns: Sequence[float],
+    trades: Sequence[Mapping[str, Any]],
+    *,
+    n_paths: int = 1000,
+    block_size: int = 5,
+    start_equity: float = 50_000.0,
+    seed: Optional[int] = None,
+    chunk_paths: int = 256,
+) -> Dict[str, Any]:
+    """Run both resampling schemes and summarise them for a proof capsule.
+
+    Parameters
+    ----------
+    returns:
+        Per-bar fractional returns of the equity curve.
+    trades:
+        Blotter rows with ``action``, ``px`` and ``size`` keys, as written by
+        :meth:`BacktestRunner.run`.
+    n_paths, block_size, start_equity, seed, chunk_paths:
+        Number of resampled paths, bootstrap block length in bars, equity the paths start from,
+        RNG seed, and paths evaluated per NumPy batch.
+
+    Returns
+    -------
+    Dict[str, Any]
+        JSON-serialisable report. A scheme is omitted when the run is too short to resample
+        (no returns, or no completed round trip).
+    """
+
+    report: Dict[str, Any] = {"n_paths": n_paths, "block_size": block_size, "seed": seed}
+    if len(returns) > 0:
+        report["bootstrap"] = summarize(
+            bootstrap_returns(
+                returns,
+                n_paths=n_paths,
+                block_size=block_size,
+                start_equity=start_equity,
+                seed=seed,
+                chunk_paths=chunk_paths,
+            )
+        )
+    if round_trip_pnl(trades).size > 0:
+        report["trade_shuffle"] = summarize(
+            shuffle_trades(
+                trades,
+                n_paths=n_paths,
+                start_equity=start_equity,
+                seed=seed,
+                chunk_paths=chunk_paths,
+            )
+        )
+    return report
+
+
+__all__ = [
+    "bootstrap_returns",
+    "robustness_report",
+    "round_trip_pnl",
+    "shuffle_trades",
+    "summarize",
+]
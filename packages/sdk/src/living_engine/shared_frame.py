@@ -0,0 +1,259 @@
+"""Share a bar dataset between worker processes through a memory-mapped file.
+
+:meth:`SharedFrame.publish` writes each column of a DataFrame into a single file once (under
+``/dev/shm`` when available, so it lives in RAM). Workers receive only the small, picklable
+:class:`SharedFrameSpec` and call :meth:`SharedFrame.attach` to map the same pages as read-only
+NumPy arrays, so memory no longer grows with the number of workers.
+
+Supported column (and index) dtypes:
+
+* NumPy numeric, boolean and naive ``datetime64``/``timedelta64`` – mapped as-is.
+* ``datetime64`` with a time zone – stored as UTC ``datetime64`` plus the zone name. pandas copies
+  these columns once when :meth:`SharedFrame.to_frame` re-applies the zone.
+* strings (``object``/``str``) and ``category`` – stored as integer codes plus a table of distinct
+  values, both in the file, and rebuilt as ``Categorical`` columns. Category values must be strings
+  or NumPy scalars.
+
+Anything else – nullable extension dtypes such as ``Int64`` or ``boolean``, non-string objects,
+``MultiIndex`` or duplicate column names – raises ``ValueError``. A non-default index is stored
+like a column, so the spec stays proportional to the number of columns, not rows.
+
+The publishing ``SharedFrame`` owns the file and removes it on :meth:`SharedFrame.close`, on exit
+from a ``with`` block, or when it is garbage collected. Attached instances never remove it.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_ALIGN = 64
+_NATIVE_KINDS = "biufcmM"
+
+
+@dataclass(frozen=True)
+class _ArraySpec:
+    dtype: str
+    offset: int
+    length: int
+
+
+@dataclass(frozen=True)
+class _ColumnSpec:
+    name: Any
+    values: _ArraySpec
+    categories: Optional[_ArraySpec] = None
+    ordered: bool = False
+    tz: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SharedFrameSpec:
+    """Picklable description of a published dataset: file path, row count and column layout."""
+
+    path: str
+    nrows: int
+    size: int
+    columns: Tuple[_ColumnSpec, ...]
+    index: Optional[_ColumnSpec] = None
+
+
+def _default_dir() -> Optional[str]:
+    shm = "/dev/shm"
+    return shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else None
+
+
+def _unlink(path: str, pid: Optional[int] = None) -> None:
+    # A forked child inherits the owner's finalizer; only the publishing process may unlink.
+    if pid is not None and pid != os.getpid():
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _codes_dtype(n_categories: int) -> np.dtype:
+    """Smallest code dtype, matching what ``pd.Categorical.from_codes`` keeps without copying."""
+
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class _Layout:
+    """Assign aligned file offsets to the arrays being published."""
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.arrays: List[Tuple[int, np.ndarray]] = []
+
+    def add(self, values: np.ndarray) -> _ArraySpec:
+        values = np.ascontiguousarray(values)
+        offset = -(-self.size // _ALIGN) * _ALIGN
+        self.arrays.append((offset, values))
+        self.size = offset + values.nbytes
+        return _ArraySpec(values.dtype.str, offset, len(values))
+
+    def encode(self, name: Any, data) -> _ColumnSpec:
+        import pandas as pd
+
+        index = pd.Index(data)
+        dtype = index.dtype
+        if isinstance(dtype, pd.DatetimeTZDtype):
+            utc = index.tz_convert("UTC").tz_localize(None).to_numpy()
+            return _ColumnSpec(name, self.add(utc), tz=str(dtype.tz))
+        if isinstance(dtype, np.dtype) and dtype.kind in _NATIVE_KINDS:
+            return _ColumnSpec(name, self.add(index.to_numpy()))
+        ordered = False
+        if isinstance(dtype, pd.CategoricalDtype):
+            codes, categories, ordered = index.codes, np.asarray(dtype.categories), dtype.ordered
+        elif pd.api.types.is_string_dtype(dtype):
+            codes, uniques = pd.factorize(index)
+            categories = np.asarray(uniques)
+        else:
+            raise ValueError(f"Column {name!r} has unsupported dtype {dtype}.")
+
+        if categories.dtype.kind not in _NATIVE_KINDS:
+            if not all(isinstance(value, str) for value in categories):
+                raise ValueError(f"Column {name!r} holds non-string objects.")
+            categories = categories.astype(str) if len(categories) else np.array([], "U1")
+        codes = codes.astype(_codes_dtype(len(categories)))
+        return _ColumnSpec(
+            name, self.add(codes), categories=self.add(categories), ordered=bool(ordered)
+        )
+
+
+class SharedFrame:
+    """Read-only view of a dataset published into a memory-mapped file."""
+
+    def __init__(self, spec: SharedFrameSpec, owner: bool = False):
+        self._spec = spec
+        self._finalizer = (
+            weakref.finalize(self, _unlink, spec.path, os.getpid()) if owner else None
+        )
+        self._buffer = np.memmap(spec.path, dtype=np.uint8, mode="r") if spec.size else None
+        self._arrays: Dict[Any, np.ndarray] = {
+            col.name: self._view(col.values) for col in spec.columns
+        }
+
+    def _view(self, array: _ArraySpec) -> np.ndarray:
+        dtype = np.dtype(array.dtype)
+        if self._buffer is None or array.length == 0:
+            values = np.empty(0, dtype=dtype)
+            values.setflags(write=False)
+            return values
+        end = array.offset + dtype.itemsize * array.length
+        return self._buffer[array.offset : end].view(dtype, np.ndarray)
+
+    def _decode(self, col: _ColumnSpec, values: np.ndarray):
+        import pandas as pd
+
+        if col.categories is not None:
+            categories = pd.Index(self._view(col.categories))
+            return pd.Categorical.from_codes(values, categories=categories, ordered=col.ordered)
+        if col.tz is not None:
+            return pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(col.tz).array
+        return values
+
+    # ------------------------------------------------------------------
+    @classmethod
+    def publish(cls, frame, directory: Path | str | None = None) -> "SharedFrame":
+        """Write ``frame`` into a new memory-mapped file and return the owning handle.
+
+        Raises
+        ------
+        ValueError
+            If a column or the index has an unsupported dtype (see the module docstring).
+        """
+
+        import pandas as pd
+
+        if isinstance(frame.columns, pd.MultiIndex) or isinstance(frame.index, pd.MultiIndex):
+            raise ValueError("MultiIndex frames cannot be shared.")
+        if not frame.columns.is_unique:
+            raise ValueError("Column names must be unique.")
+
+        layout = _Layout()
+        columns = tuple(layout.encode(name, frame[name]) for name in frame.columns)
+        index = None
+        default_index = pd.RangeIndex(len(frame))
+        if not (frame.index.equals(default_index) and frame.index.name is None):
+            index = layout.encode(frame.index.name, frame.index)
+
+        fd, path = tempfile.mkstemp(
+            prefix="living-engine-", suffix=".frame", dir=directory or _default_dir()
+        )
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for offset, values in layout.arrays:
+                    handle.seek(offset)
+                    handle.write(values.view(np.uint8).data)
+                handle.truncate(layout.size)
+        except BaseException:
+            _unlink(path)
+            raise
+        spec = SharedFrameSpec(path, len(frame), layout.size, columns, index)
+        return cls(spec, owner=True)
+
+    @classmethod
+    def attach(cls, spec: SharedFrameSpec) -> "SharedFrame":
+        """Map a published dataset without taking ownership of its file."""
+
+        return cls(spec)
+
+    # ------------------------------------------------------------------
+    @property
+    def spec(self) -> SharedFrameSpec:
+        """Handle to send to workers."""
+
+        return self._spec
+
+    @property
+    def arrays(self) -> Dict[Any, np.ndarray]:
+        """Read-only column arrays as stored: categorical columns as codes, zoned times as UTC."""
+
+        return dict(self._arrays)
+
+    def to_frame(self):
+        """Build a DataFrame whose columns are views of the mapped file."""
+
+        import pandas as pd
+
+        data = {col.name: self._decode(col, self._arrays[col.name]) for col in self._spec.columns}
+        index = pd.RangeIndex(self._spec.nrows)
+        if self._spec.index is not None:
+            col = self._spec.index
+            index = pd.Index(self._decode(col, self._view(col.values)), name=col.name, copy=False)
+        return pd.DataFrame(data, index=index, copy=False)
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Release this handle's mapping; the owner also removes the backing file.
+
+        Arrays or frames obtained earlier stay valid until they are garbage collected.
+        """
+
+        self._arrays = {}
+        self._buffer = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __reduce__(self):
+        return (SharedFrame.attach, (self._spec,))
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+__all__ = ["SharedFrame", "SharedFrameSpec"]
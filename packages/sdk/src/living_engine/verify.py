@@ -0,0 +1,227 @@
+"""Audit helpers that re-check run directories produced by :class:`BacktestRunner`.
+
+A run directory is expected to hold ``proof_capsule.json``, ``proof_ledger.csv`` and
+``capsules.jsonl``. Verification validates the capsule against its schema version, re-hashes the
+ledger files (and optionally the source dataset) on a thread pool, and cross-checks that the
+JSONL stream and the CSV ledger recorded the same number of capsules.
+
+Run ``python -m living_engine.verify RUN_DIR [RUN_DIR ...]`` for a per-directory PASS/FAIL report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, TypedDict
+
+from .proofbridge import sha256_file
+
+CAPSULE_FILE = "proof_capsule.json"
+LEDGER_FILE = "proof_ledger.csv"
+CAPSULES_FILE = "capsules.jsonl"
+
+_CHUNK_SIZE = 1 << 20
+_HEX_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+class RunVerification(TypedDict):
+    """Structured result for :func:`verify_run` and :func:`verify_runs`."""
+
+    run_dir: str
+    ok: bool
+    errors: List[str]
+    digests: Dict[str, str]
+
+
+@dataclass(frozen=True)
+class _CapsuleSchema:
+    """Field/type table for one capsule schema version, built once at import time."""
+
+    version: str
+    fields: Tuple[Tuple[str, type], ...]
+
+    def validate(self, capsule: Mapping[str, Any]) -> List[str]:
+        errors = []
+        for name, expected in self.fields:
+            if name not in capsule:
+                errors.append(f"capsule missing field '{name}'")
+            elif not isinstance(capsule[name], expected):
+                actual = type(capsule[name]).__name__
+                errors.append(f"capsule field '{name}' is {actual}, expected {expected.__name__}")
+        digest = capsule.get("data_sha256")
+        if isinstance(digest, str) and digest and not _HEX_DIGEST.fullmatch(digest):
+            errors.append("capsule field 'data_sha256' is not a hex SHA-256 digest")
+        return errors
+
+
+_SCHEMAS: Dict[str, _CapsuleSchema] = {
+    schema.version: schema
+    for schema in (
+        _CapsuleSchema(
+            version="capsule-1.1.0",
+            fields=(
+                ("schema_version", str),
+                ("created_utc", str),
+                ("data_source", str),
+                ("data_sha256", str),
+                ("params", dict),
+                ("verdict", str),
+                ("evidence", dict),
+                ("metrics", dict),
+            ),
+        ),
+    )
+}
+
+
+def validate_capsule(capsule: Any) -> List[str]:
+    """Return a list of schema violations for ``capsule`` (empty when it is valid)."""
+
+    if not isinstance(capsule, dict):
+        return ["capsule is not a JSON object"]
+    version = capsule.get("schema_version")
+    schema = _SCHEMAS.get(version) if isinstance(version, str) else None
+    if schema is None:
+        return [f"unsupported schema_version {version!r}"]
+    return schema.validate(capsule)
+
+
+def _digest_and_count(path: Path, chunk_size: int) -> Tuple[str, int]:
+    """Hash ``path`` and count its lines in a single pass."""
+
+    digest = hashlib.sha256()
+    lines = 0
+    last = b"\n"
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        lines += 1
+    return digest.hexdigest(), lines
+
+
+def _check_run(
+    run_dir: Path,
+    hashed: Mapping[Path, Future],
+    data_digest: Optional[Future],
+) -> RunVerification:
+    errors: List[str] = []
+    digests: Dict[str, str] = {}
+    counts: Dict[str, int] = {}
+
+    capsule: Any = None
+    try:
+        capsule = json.loads((run_dir / CAPSULE_FILE).read_text(encoding="utf-8"))
+    except OSError:
+        errors.append(f"missing {CAPSULE_FILE}")
+    except ValueError as exc:
+        errors.append(f"{CAPSULE_FILE} is not valid JSON: {exc}")
+    else:
+        errors.extend(validate_capsule(capsule))
+
+    for name in (LEDGER_FILE, CAPSULES_FILE):
+        try:
+            digests[name], counts[name] = hashed[run_dir / name].result()
+        except OSError:
+            errors.append(f"missing {name}")
+
+    if LEDGER_FILE in counts and CAPSULES_FILE in counts:
+        ledger_rows = counts[LEDGER_FILE] - 1
+        if ledger_rows < 0:
+            errors.append(f"{LEDGER_FILE} has no header")
+        elif ledger_rows != counts[CAPSULES_FILE]:
+            errors.append(
+                f"{CAPSULES_FILE} has {counts[CAPSULES_FILE]} lines but "
+                f"{LEDGER_FILE} has {ledger_rows} rows"
+            )
+
+    if data_digest is not None and isinstance(capsule, dict):
+        try:
+            digests["data"] = data_digest.result()
+        except OSError:
+            errors.append("dataset could not be read")
+        else:
+            if capsule.get("data_sha256") != digests["data"]:
+                errors.append("data_sha256 does not match the dataset")
+
+    return RunVerification(run_dir=str(run_dir), ok=not errors, errors=errors, digests=digests)
+
+
+def verify_runs(
+    run_dirs: Iterable[Path | str],
+    data_path: Path | str | None = None,
+    *,
+    max_workers: Optional[int] = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> List[RunVerification]:
+    """Verify many run directories, hashing all ledger files concurrently.
+
+    Parameters
+    ----------
+    run_dirs:
+        Directories written by :meth:`BacktestRunner.run`.
+    data_path:
+        Optional dataset the runs were produced from. It is hashed once and compared against
+        each capsule's ``data_sha256``.
+    max_workers:
+        Size of the hashing thread pool. ``hashlib`` releases the GIL on large buffers, so threads
+        scale with disk bandwidth. Defaults to the :class:`ThreadPoolExecutor` default.
+    chunk_size:
+        Read size in bytes used when hashing.
+
+    Returns
+    -------
+    List[RunVerification]
+        One result per directory, in input order.
+    """
+
+    dirs = [Path(d) for d in run_dirs]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        data_digest = pool.submit(sha256_file, data_path, chunk_size) if data_path else None
+        hashed = {
+            d / name: pool.submit(_digest_and_count, d / name, chunk_size)
+            for d in dirs
+            for name in (LEDGER_FILE, CAPSULES_FILE)
+        }
+        return [_check_run(d, hashed, data_digest) for d in dirs]
+
+
+def verify_run(
+    run_dir: Path | str,
+    data_path: Path | str | None = None,
+    *,
+    chunk_size: int = _CHUNK_SIZE,
+) -> RunVerification:
+    """Verify a single run directory. See :func:`verify_runs`."""
+
+    return verify_runs([run_dir], data_path, chunk_size=chunk_size)[0]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Verify Living Engine run directories.")
+    parser.add_argument("run_dirs", nargs="+", type=Path)
+    parser.add_argument("--data", type=Path, default=None, help="dataset to check data_sha256")
+    parser.add_argument("--workers", type=int, default=None, help="hashing thread pool size")
+    args = parser.parse_args(argv)
+
+    results = verify_runs(args.run_dirs, args.data, max_workers=args.workers)
+    for result in results:
+        if result["ok"]:
+            print(f"PASS {result['run_dir']}")
+        else:
+            print(f"FAIL {result['run_dir']}: {'; '.join(result['errors'])}")
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+__all__ = ["RunVerification", "validate_capsule", "verify_run", "verify_runs"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,187 @@
+"""Tests for tick-to-bar aggregation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from living_engine.bars import (
+    BAR_COLUMNS,
+    BarRule,
+    TickAggregator,
+    _BulkAggregator,
+    aggregate_csv,
+    aggregate_ticks,
+    drive_strategy,
+    stream_bars,
+)
+from living_engine.imm_core import ImmCore
+
+
+def _ticks(n: int = 500, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2024-01-02 09:30")
+    offsets = np.cumsum(rng.integers(1, 20, size=n))
+    return pd.DataFrame(
+        {
+            "timestamp": start + pd.to_timedelta(offsets, unit="s"),
+            "symbol": rng.choice(["AAPL", "MSFT"], size=n),
+            "price": 100 + np.cumsum(rng.normal(0, 0.1, size=n)),
+            "size": rng.integers(1, 50, size=n).astype(float),
+            "entropy": rng.uniform(0, 0.2, size=n),
+        }
+    )
+
+
+def _streamed(ticks: pd.DataFrame, rule: BarRule) -> pd.DataFrame:
+    bars = pd.DataFrame(list(stream_bars(ticks.to_dict("records"), rule)))
+    return bars.sort_values(["symbol", "timestamp"], kind="stable").reset_index(drop=True)
+
+
+def _by_symbol(bars: pd.DataFrame) -> pd.DataFrame:
+    bars = bars.assign(timestamp=bars["timestamp"].astype(str))
+    return bars.sort_values(["symbol", "timestamp"], kind="stable").reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [BarRule("time", 60), BarRule("tick", 7), BarRule("volume", 100)],
+    ids=["time", "tick", "volume"],
+)
+def test_bulk_matches_incremental(rule: BarRule) -> None:
+    ticks = _ticks()
+    bulk = aggregate_ticks(ticks, rule)
+    assert tuple(bulk.columns) == BAR_COLUMNS
+    assert bulk["timestamp"].is_monotonic_increasing
+    assert bulk["volume"].sum() == pytest.approx(ticks["size"].sum())
+    pd.testing.assert_frame_equal(_by_symbol(bulk), _streamed(ticks, rule), check_dtype=False)
+
+
+@pytest.mark.parametrize("rule", [BarRule("time", 45), BarRule("volume", 120)], ids=str)
+def test_csv_chunks_match_single_pass(tmp_path: Path, rule: BarRule) -> None:
+    ticks = _ticks(seed=1)
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+    expected = aggregate_ticks(pd.read_csv(path), rule)
+    pd.testing.assert_frame_equal(aggregate_csv(path, rule, chunksize=37), expected)
+
+
+@pytest.mark.parametrize("rule", [BarRule("time", 86_400), BarRule("volume", 1e9)], ids=str)
+def test_bar_spanning_many_chunks_matches_single_pass(tmp_path: Path, rule: BarRule) -> None:
+    ticks = _ticks(2_000, seed=2)
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+    expected = aggregate_ticks(pd.read_csv(path), rule)
+    assert len(expected) == 2
+    pd.testing.assert_frame_equal(aggregate_csv(path, rule, chunksize=13), expected)
+
+
+def test_tick_bars_close_on_count() -> None:
+    agg = TickAggregator(BarRule("tick", 2))
+    tick = {"timestamp": "2024-01-02 09:30", "price": 10.0, "size": 5, "entropy": 0.1}
+    assert agg.update(tick) is None
+    bar = agg.update({**tick, "timestamp": "2024-01-02 09:31", "price": 11.0, "entropy": 0.3})
+    assert bar == {
+        "timestamp": "2024-01-02 09:31:00",
+        "symbol": "X",
+        "open": 10.0,
+        "high": 11.0,
+        "low": 10.0,
+        "close": 11.0,
+        "volume": 10.0,
+        "entropy": pytest.approx(0.2),
+    }
+    assert agg.flush() == []
+
+
+@pytest.mark.parametrize(
+    "rule,sizes", [(BarRule("tick", 3), [1, 1, 1]), (BarRule("volume", 10), [4, 4, 4])]
+)
+def test_flush_resets_counts(rule: BarRule, sizes: list) -> None:
+    agg = TickAggregator(rule)
+    tick = {"timestamp": "2024-01-02 09:30", "price": 10.0, "size": 4}
+    assert agg.update(tick) is None
+    assert len(agg.flush()) == 1
+
+    # A new session must need a full threshold again, not the remainder of the last one.
+    results = [agg.update({**tick, "size": size}) for size in sizes]
+    assert results[:2] == [None, None]
+    assert results[2] is not None and results[2]["volume"] == sum(sizes)
+
+
+@pytest.mark.parametrize("rule", [BarRule("time", 60), BarRule("tick", 2)], ids=str)
+def test_timezone_is_preserved(rule: BarRule) -> None:
+    ticks = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(["2024-01-02 09:30:05", "2024-01-02 09:30:40"]),
+            "price": [10.0, 11.0],
+            "size": [1.0, 1.0],
+        }
+    )
+    ticks["timestamp"] = ticks["timestamp"].dt.tz_localize("America/New_York")
+
+    bulk = aggregate_ticks(ticks, rule)
+    assert str(bulk["timestamp"].dt.tz) == "America/New_York"
+    assert bulk["timestamp"].iloc[0].hour == 9
+    pd.testing.assert_frame_equal(_by_symbol(bulk), _streamed(ticks, rule), check_dtype=False)
+    assert _streamed(ticks, rule)["timestamp"].iloc[0].endswith("-05:00")
+
+
+@pytest.mark.parametrize("rule", [BarRule("time", 3600), BarRule("tick", 2)], ids=str)
+def test_offsets_across_dst_change(tmp_path: Path, rule: BarRule) -> None:
+    stamps = pd.date_range("2024-03-10 00:00", periods=6, freq="h", tz="America/New_York")
+    ticks = pd.DataFrame({"timestamp": stamps, "price": np.arange(6.0), "size": 1.0})
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+    assert pd.read_csv(path)["timestamp"].str[-6:].nunique() == 2
+
+    named = aggregate_ticks(ticks, rule)
+    from_csv = aggregate_csv(path, rule, chunksize=2)
+    assert from_csv["volume"].sum() == 6
+    assert (from_csv["timestamp"] == named["timestamp"]).all()
+    streamed = _streamed(pd.read_csv(path), rule)
+    pd.testing.assert_frame_equal(_by_symbol(from_csv), streamed, check_dtype=False)
+
+    # A named zone keeps DST-aware stamps on both paths.
+    assert {t.utcoffset() for t in named["timestamp"]} == {
+        pd.Timedelta(hours=-5),
+        pd.Timedelta(hours=-4),
+    }
+    pd.testing.assert_frame_equal(_by_symbol(named), _streamed(ticks, rule), check_dtype=False)
+
+
+def test_empty_first_chunk_does_not_fix_awareness() -> None:
+    ticks = pd.DataFrame({"timestamp": ["2024-01-02 09:30-05:00"], "price": [1.0], "size": [1.0]})
+    aggregator = _BulkAggregator(BarRule("tick", 5))
+    aggregator.add(ticks.iloc[:0])
+    aggregator.add(ticks)
+    assert len(aggregator.finish()) == 1
+
+
+def test_naive_and_aware_mix_rejected() -> None:
+    agg = TickAggregator(BarRule("tick", 5))
+    agg.update({"timestamp": "2024-01-02 09:30", "price": 1.0, "size": 1})
+    with pytest.raises(ValueError):
+        agg.update({"timestamp": "2024-01-02 09:31-05:00", "price": 1.0, "size": 1})
+
+
+def test_drive_strategy_feeds_on_bar() -> None:
+    params = {
+        "entropy": {"P_threshold": 0.05, "NP_threshold": 0.1, "CollapseThreshold": 0.2},
+        "signals": {"EmaFast": 3, "EmaSlow": 5},
+    }
+    strategy = ImmCore(params)
+    strategy.on_start()
+    ticks = _ticks(200).to_dict("records")
+    steps = list(drive_strategy(strategy, ticks, BarRule("tick", 10)))
+    assert len(steps) == 20
+    assert all(set(bar) == set(BAR_COLUMNS) for bar, _, _ in steps)
+
+
+@pytest.mark.parametrize("kind,threshold", [("range", 1), ("time", 0), ("tick", 2.5)])
+def test_invalid_rules_rejected(kind: str, threshold: float) -> None:
+    with pytest.raises(ValueError):
+        BarRule(kind, threshold)  # type: ignore[arg-type]
@@ -0,0 +1,74 @@
+"""Tests for Monte Carlo robustness analysis."""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from living_engine.backtest_runner import BacktestRunner, _sharpe
+from living_engine.robustness import (
+    bootstrap_returns,
+    robustness_report,
+    round_trip_pnl,
+    shuffle_trades,
+)
+
+TRADES = [
+    {"ts": "t0", "action": "BUY", "px": 100.0, "size": 10},
+    {"ts": "t1", "action": "SELL", "px": 90.0, "size": 10},
+    {"ts": "t2", "action": "BUY", "px": 90.0, "size": 10},
+    {"ts": "t3", "action": "SELL", "px": 110.0, "size": 10},
+    {"ts": "t4", "action": "BUY", "px": 110.0, "size": 10},
+]
+
+
+def test_bootstrap_is_chunk_invariant_and_seeded() -> None:
+    returns = np.random.default_rng(0).normal(0.0, 0.01, size=50)
+    a = bootstrap_returns(returns, n_paths=300, block_size=4, seed=3, chunk_paths=64)
+    b = bootstrap_returns(returns, n_paths=300, block_size=4, seed=3, chunk_paths=300)
+    assert a["sharpe"].shape == (300,)
+    np.testing.assert_array_equal(a["sharpe"], b["sharpe"])
+    np.testing.assert_array_equal(a["max_drawdown"], b["max_drawdown"])
+    assert (a["max_drawdown"] >= 0).all()
+
+
+def test_full_block_reproduces_original_metrics() -> None:
+    returns = [0.01, -0.02, 0.015, 0.0, -0.005]
+    samples = bootstrap_returns(returns, n_paths=7, block_size=len(returns), start_equity=100.0)
+    assert np.allclose(samples["sharpe"], _sharpe(returns))
+    assert np.allclose(samples["final_equity"], 100.0 * np.prod(1 + np.array(returns)))
+
+
+def test_trade_shuffle_drawdown_bounds() -> None:
+    assert round_trip_pnl(TRADES).tolist() == [-100.0, 200.0]
+    dd = shuffle_trades(TRADES, n_paths=200, start_equity=1000.0, seed=1, chunk_paths=64)
+    # Either the loss comes first (10% drawdown) or after the gain (100 / 1200).
+    assert set(np.round(dd["max_drawdown"], 6)) == {0.1, round(100 / 1200, 6)}
+
+
+def test_report_omits_schemes_without_data() -> None:
+    report = robustness_report([], [], n_paths=10)
+    assert "bootstrap" not in report and "trade_shuffle" not in report
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_runner_records_robustness_in_capsule(tmp_path: Path) -> None:
+    sdk_root = Path(__file__).resolve().parents[1]
+    config = yaml.safe_load((sdk_root / "config/default.yaml").read_text())
+    config["robustness"] = {"Paths": 500, "BlockSize": 3, "Seed": 11}
+    data = pd.read_csv(sdk_root / "data/sample.csv")
+
+    artifacts = BacktestRunner(config=config, frame=data).run(outdir=tmp_path)
+    capsule = json.loads(Path(artifacts["capsule"]).read_text())
+
+    summary = capsule["robustness"]["bootstrap"]
+    assert set(summary) == {"sharpe", "max_drawdown", "final_equity"}
+    for stats in summary.values():
+        assert stats["p05"] <= stats["p50"] <= stats["p95"]
+        assert all(math.isfinite(v) for v in stats.values())
@@ -0,0 +1,119 @@
+"""Tests for memory-mapped datasets shared with worker processes."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from living_engine.backtest_runner import BacktestRunner
+from living_engine.shared_frame import SharedFrame, SharedFrameSpec
+
+SDK_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _sample() -> pd.DataFrame:
+    return pd.read_csv(SDK_ROOT / "data/sample.csv", parse_dates=["timestamp"])
+
+
+def _worker_run(args: tuple[SharedFrameSpec, str]) -> dict:
+    spec, outdir = args
+    config = yaml.safe_load((SDK_ROOT / "config/default.yaml").read_text())
+    artifacts = BacktestRunner.from_shared(config, spec).run(outdir=outdir)
+    return json.loads(Path(artifacts["metrics"]).read_text())
+
+
+def test_round_trip_is_read_only_view(tmp_path: Path) -> None:
+    frame = _sample()
+    with SharedFrame.publish(frame, directory=tmp_path) as shared:
+        attached = SharedFrame.attach(shared.spec)
+        close = attached.arrays["close"]
+        assert not close.flags.writeable
+        with pytest.raises(ValueError):
+            close[0] = 0.0
+
+        rebuilt = attached.to_frame()
+        assert np.shares_memory(rebuilt["close"].to_numpy(), close)
+        assert np.shares_memory(rebuilt["symbol"].array.codes, attached.arrays["symbol"])
+        pd.testing.assert_frame_equal(rebuilt, frame, check_dtype=False, check_categorical=False)
+        assert (rebuilt["symbol"].astype(str) == frame["symbol"]).all()
+
+
+def test_spec_size_independent_of_rows(tmp_path: Path) -> None:
+    n = 50_000
+    frame = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=n, freq="min").astype(str),
+            "close": np.arange(n, dtype=float),
+        }
+    )
+    with SharedFrame.publish(frame, directory=tmp_path) as shared:
+        assert len(pickle.dumps(shared.spec)) < 2_000
+        rebuilt = SharedFrame.attach(shared.spec).to_frame()
+        assert (rebuilt["timestamp"].astype(str) == frame["timestamp"]).all()
+
+
+def test_index_timezone_and_ordered_categories_round_trip(tmp_path: Path) -> None:
+    frame = pd.DataFrame(
+        {
+            "ts": pd.date_range("2024-01-02 09:30", periods=3, freq="min", tz="America/New_York"),
+            "grade": pd.Categorical(["lo", "hi", "lo"], categories=["lo", "hi"], ordered=True),
+            "qty": np.array([1, 2, 3], dtype=np.int64),
+        },
+        index=pd.Index([10, 20, 30], name="row"),
+    )
+    with SharedFrame.publish(frame, directory=tmp_path) as shared:
+        pd.testing.assert_frame_equal(SharedFrame.attach(shared.spec).to_frame(), frame)
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        pd.DataFrame({"a": pd.array([1, None], dtype="Int64")}),
+        pd.DataFrame({"a": [object(), 1]}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+    ],
+    ids=["nullable", "objects", "duplicates"],
+)
+def test_unsupported_frames_rejected(tmp_path: Path, frame: pd.DataFrame) -> None:
+    with pytest.raises(ValueError):
+        SharedFrame.publish(frame, directory=tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_owner_close_removes_file_and_pickle_attaches(tmp_path: Path) -> None:
+    shared = SharedFrame.publish(_sample(), directory=tmp_path)
+    path = shared.spec.path
+    clone = pickle.loads(pickle.dumps(shared))
+    clone.close()
+    assert os.path.exists(path)
+
+    shared.close()
+    shared.close()
+    assert not os.path.exists(path)
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork start method"
+)
+def test_pool_workers_match_in_process_run(tmp_path: Path) -> None:
+    config = yaml.safe_load((SDK_ROOT / "config/default.yaml").read_text())
+    expected = json.loads(
+        Path(BacktestRunner(config, _sample()).run(tmp_path / "local")["metrics"]).read_text()
+    )
+
+    with SharedFrame.publish(_sample(), directory=tmp_path) as shared:
+        jobs = [(shared.spec, str(tmp_path / f"w{i}")) for i in range(2)]
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            results = pool.map(_worker_run, jobs)
+
+    assert results == [expected, expected]
+    assert list(tmp_path.glob("*.frame")) == []
@@ -0,0 +1,76 @@
+"""Tests for run directory verification."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import yaml
+
+from living_engine.backtest_runner import BacktestRunner
+from living_engine.verify import main, validate_capsule, verify_run, verify_runs
+
+SDK_ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_CSV = SDK_ROOT / "data/sample.csv"
+
+
+def _run(outdir: Path) -> Path:
+    config = yaml.safe_load((SDK_ROOT / "config/default.yaml").read_text())
+    BacktestRunner(config=config, frame=pd.read_csv(SAMPLE_CSV)).run(outdir=outdir)
+    return outdir
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_fresh_runs_pass(tmp_path: Path) -> None:
+    dirs = [_run(tmp_path / f"run{i}") for i in range(3)]
+    results = verify_runs(dirs, SAMPLE_CSV, max_workers=4)
+    assert [r["ok"] for r in results] == [True, True, True]
+    assert {"proof_ledger.csv", "capsules.jsonl", "data"} <= set(results[0]["digests"])
+    assert main([str(d) for d in dirs]) == 0
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_line_count_mismatch_fails(tmp_path: Path) -> None:
+    run_dir = _run(tmp_path)
+    with (run_dir / "capsules.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"ts":"extra"}\n')
+    result = verify_run(run_dir)
+    assert not result["ok"]
+    assert any("capsules.jsonl" in e for e in result["errors"])
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_data_digest_mismatch_fails(tmp_path: Path) -> None:
+    run_dir = _run(tmp_path / "run")
+    other = tmp_path / "other.csv"
+    other.write_text("timestamp,close\n")
+    result = verify_run(run_dir, other)
+    assert result["errors"] == ["data_sha256 does not match the dataset"]
+
+
+def test_missing_directory_reports_every_artifact(tmp_path: Path) -> None:
+    result = verify_run(tmp_path / "nope")
+    assert not result["ok"]
+    assert len(result["errors"]) == 3
+
+
+def test_validate_capsule_checks_fields_and_types() -> None:
+    capsule = {
+        "schema_version": "capsule-1.1.0",
+        "created_utc": "2024-01-01T00:00:00Z",
+        "data_source": "csv",
+        "data_sha256": "",
+        "params": {},
+        "verdict": "OPEN",
+        "evidence": [],
+        "metrics": {},
+    }
+    assert validate_capsule(capsule) == ["capsule field 'evidence' is list, expected dict"]
+    del capsule["verdict"]
+    assert "capsule missing field 'verdict'" in validate_capsule(capsule)
+    assert validate_capsule({"schema_version": "capsule-0.9"}) == [
+        "unsupported schema_version 'capsule-0.9'"
+    ]
+    assert validate_capsule(json.loads("[]")) == ["capsule is not a JSON object"]